@@ -1,14 +1,24 @@
 # Whisper Japanese Transcription Web App – Enhanced Professional UI
 # CPU-only, offline-friendly, multi-audio library
-# Tech stack: FastAPI + Whisper + SQLite + HTML/CSS/JS (no frontend framework)
+# Tech stack: FastAPI + faster-whisper + SQLite + HTML/CSS/JS (no frontend framework)
 
+import asyncio
+import hashlib
 import uuid
 import os
 import sqlite3
-import json
-from fastapi import FastAPI, UploadFile, File
-from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
-import whisper
+import tempfile
+import threading
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, File, Request, BackgroundTasks
+from fastapi.responses import HTMLResponse, FileResponse, Response
+from starlette.middleware.gzip import GZipMiddleware
+import aiofiles
+import av
+import numpy as np
+import orjson
+from faster_whisper import WhisperModel
+from faster_whisper.vad import SpeechTimestampsMap, collect_chunks, get_speech_timestamps
 
 UPLOAD_DIR = "uploads"
 DB_PATH = "app.db"
@@ -22,13 +32,17 @@ def load_config():
     default_config = {
         "language": "ja",
         "model_size": "base",
-        "device": "cpu"
+        "device": "cpu",
+        "compute_type": "int8",
+        "backend": "faster-whisper",
+        "cpu_threads": 0,
+        "vad_filter": True
     }
     
     if os.path.exists(CONFIG_PATH):
         try:
-            with open(CONFIG_PATH, 'r') as f:
-                config = json.load(f)
+            with open(CONFIG_PATH, 'rb') as f:
+                config = orjson.loads(f.read())
                 # Merge with defaults for missing keys
                 return {**default_config, **config}
         except Exception as e:
@@ -36,8 +50,8 @@ def load_config():
             print("Using default configuration")
     else:
         # Create default config file
-        with open(CONFIG_PATH, 'w') as f:
-            json.dump(default_config, f, indent=2)
+        with open(CONFIG_PATH, 'wb') as f:
+            f.write(orjson.dumps(default_config, option=orjson.OPT_INDENT_2))
         print("Created default config.json")
     
     return default_config
@@ -48,41 +62,265 @@ os.makedirs(UPLOAD_DIR, exist_ok=True)
 # ----------------------
 # Database setup
 # ----------------------
-conn = sqlite3.connect(DB_PATH, check_same_thread=False)
-cursor = conn.cursor()
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS audio (
-    id TEXT PRIMARY KEY,
-    filename TEXT,
-    original_name TEXT
-)
-""")
-cursor.execute("""
-CREATE TABLE IF NOT EXISTS segments (
-    audio_id TEXT,
-    start REAL,
-    end REAL,
-    text TEXT
-)
-""")
-conn.commit()
+INSERT_AUDIO_SQL = "INSERT INTO audio VALUES (?, ?, ?)"
+INSERT_SEGMENT_SQL = "INSERT INTO segments VALUES (?, ?, ?, ?)"
+SEL_LIB_SQL = "SELECT id, original_name FROM audio"
+SEL_FILENAME_SQL = "SELECT filename FROM audio WHERE id=?"
+SEL_AUDIO_DATA_SQL = """
+SELECT a.filename, s.start, s.end, s.text
+FROM audio a LEFT JOIN segments s ON s.audio_id = a.id
+WHERE a.id=?
+ORDER BY s.rowid
+"""
+HAS_FILENAME_SQL = "SELECT 1 FROM audio WHERE filename=?"
+DEL_SEGMENTS_SQL = "DELETE FROM segments WHERE audio_id=?"
+DEL_AUDIO_SQL = "DELETE FROM audio WHERE id=?"
+
+def connect(readonly=False):
+    """Open a SQLite connection with the per-connection PRAGMAs applied"""
+    if readonly:
+        # Read-only connections never take the WAL write lock
+        db = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True)
+    else:
+        db = sqlite3.connect(DB_PATH)
+    db.execute("PRAGMA synchronous=NORMAL")
+    db.execute("PRAGMA temp_store=MEMORY")
+    db.execute("PRAGMA cache_size=-65536")
+    db.execute("PRAGMA mmap_size=268435456")
+    return db
+
+# One writer and one reader connection per thread instead of a shared cursor.
+# Nothing is opened at import, so forked gunicorn workers never inherit one.
+_local = threading.local()
+
+def get_db():
+    """Return this thread's read/write connection"""
+    if not hasattr(_local, "db"):
+        _local.db = connect()
+    return _local.db
+
+def get_reader():
+    """Return this thread's read-only connection"""
+    if not hasattr(_local, "reader"):
+        _local.reader = connect(readonly=True)
+    return _local.reader
+
+def init_db():
+    """Create the schema and switch the database file to WAL"""
+    db = connect()
+    # WAL is persistent and lets library/transcript reads run during commits
+    db.execute("PRAGMA journal_mode=WAL")
+    db.execute("""
+    CREATE TABLE IF NOT EXISTS audio (
+        id TEXT PRIMARY KEY,
+        filename TEXT,
+        original_name TEXT
+    )
+    """)
+    db.execute("""
+    CREATE TABLE IF NOT EXISTS segments (
+        audio_id TEXT,
+        start REAL,
+        end REAL,
+        text TEXT
+    )
+    """)
+    db.execute("CREATE INDEX IF NOT EXISTS idx_seg_audio ON segments(audio_id)")
+    # /audio checks every (Range) request against the library by filename
+    db.execute("CREATE INDEX IF NOT EXISTS idx_audio_filename ON audio(filename)")
+    db.commit()
+    db.close()
+
+init_db()
 
 # ----------------------
-# App & Model
+# Model
 # ----------------------
-app = FastAPI()
+def cpu_threads():
+    """Threads per model call: configured value, else roughly one per physical core"""
+    if config['cpu_threads']:
+        return config['cpu_threads']
+    # Count only the CPUs this process may run on (affinity/cpuset limits in
+    # containers); os.cpu_count() reports the whole host
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 2
+    # Those include SMT siblings; oversubscribing them slows int8 GEMMs
+    return max(1, available // 2)
+
+def load_model():
+    """Load the configured transcription backend"""
+    if config['backend'] == "whisper.cpp":
+        # Optional dependency; model_size may name a quantized GGML model (e.g. base-q5_1)
+        from pywhispercpp.model import Model as WhisperCpp
+        return WhisperCpp(config['model_size'], n_threads=cpu_threads())
+    # The worker runs one job at a time, so one CTranslate2 replica is enough
+    return WhisperModel(
+        config['model_size'],
+        device=config['device'],
+        compute_type=config['compute_type'],
+        cpu_threads=cpu_threads(),
+        num_workers=1
+    )
+
+def load_mono16k(path):
+    """Decode audio to 16 kHz mono float32, cached next to the upload as .f32.npy"""
+    cache_path = path + ".f32.npy"
+    if os.path.exists(cache_path):
+        return np.load(cache_path)
+    # Decode in-process with libavcodec, resampling straight to float32 mono.
+    # Tags are often not UTF-8 (e.g. Shift-JIS titles), so ignore bad metadata
+    resampler = av.AudioResampler(format="flt", layout="mono", rate=16000)
+    chunks = []
+    with av.open(path, metadata_errors="ignore") as container:
+        for packet in container.demux(audio=0):
+            try:
+                frames = packet.decode()
+            except av.error.InvalidDataError:
+                # Skip the damaged packet but keep decoding the rest of the file
+                continue
+            for frame in frames:
+                chunks.extend(f.to_ndarray().ravel() for f in resampler.resample(frame))
+        # Flush whatever the resampler is still buffering
+        chunks.extend(f.to_ndarray().ravel() for f in resampler.resample(None))
+    audio = np.concatenate(chunks) if chunks else np.zeros(0, dtype=np.float32)
+
+    # Write beside the upload and rename into place, so a crash mid-write can't
+    # leave a truncated cache that every later load would trip over
+    fd, tmp_path = tempfile.mkstemp(dir=UPLOAD_DIR, suffix=".npy.tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, audio)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    return audio
+
+def run_transcription(audio, vad_filter=True):
+    """Transcribe a 16 kHz mono float32 array into (start, end, text) tuples (blocking)"""
+    vad_filter = vad_filter and config['vad_filter']
+
+    if config['backend'] == "whisper.cpp":
+        # whisper.cpp reports timestamps in 10 ms ticks
+        if not vad_filter:
+            segments = model.transcribe(audio, language=config['language'])
+            return [(s.t0 / 100, s.t1 / 100, s.text) for s in segments]
+
+        # whisper.cpp has no VAD of its own. As faster-whisper does internally,
+        # join the Silero-voiced spans into one buffer, transcribe it in a single
+        # pass and map the timestamps back onto the original audio
+        spans = get_speech_timestamps(audio)
+        if not spans:
+            return []
+        voiced = np.concatenate(collect_chunks(audio, spans)[0])
+        ts_map = SpeechTimestampsMap(spans, 16000)
+        segments = model.transcribe(voiced, language=config['language'])
+        return [
+            (
+                ts_map.get_original_time(s.t0 / 100),
+                ts_map.get_original_time(s.t1 / 100, is_end=True),
+                s.text
+            )
+            for s in segments
+        ]
+
+    # Use configured language; segments are decoded lazily, so consume them here
+    segments, _ = model.transcribe(
+        audio,
+        language=config['language'],
+        vad_filter=vad_filter,
+        beam_size=1
+    )
+    return [(s.start, s.end, s.text) for s in segments]
+
+# Loaded per process in lifespan(): CTranslate2's worker threads don't survive
+# a fork, so a model created before gunicorn forks would hang in every worker
+model = None
 
-# Load model with configured device and size
-print(f"Loading Whisper model '{config['model_size']}' on device '{config['device']}'...")
-model = whisper.load_model(config['model_size'], device=config['device'])
-print("Model loaded successfully!")
+def init_model():
+    """Load the model with configured backend, device and size, then warm it up"""
+    global model
+    print(f"Loading {config['backend']} model '{config['model_size']}' on device '{config['device']}'...")
+    model = load_model()
+    print("Model loaded successfully!")
+
+    # One-shot warmup on a second of silence so the first upload doesn't pay
+    # for lazy kernel/allocator initialisation (VAD off, or it would skip it all)
+    run_transcription(np.zeros(16000, dtype=np.float32), vad_filter=False)
+    print("Model warmed up!")
+
+# ----------------------
+# Transcription worker
+# ----------------------
+# Jobs are (upload path, future) pairs. The worker decodes each file itself,
+# so at most one decoded buffer is alive however many uploads are queued, and
+# a single consumer owns the model instead of contending for the CPU cores
+transcription_queue = None
+
+def has_audio_row(path):
+    """Whether a library entry refers to this upload"""
+    filename = os.path.basename(path)
+    return get_reader().execute(HAS_FILENAME_SQL, (filename,)).fetchone() is not None
+
+async def transcription_worker():
+    """Decode and transcribe queued uploads against the shared model, one at a time"""
+    while True:
+        path, future = await transcription_queue.get()
+        try:
+            # The client went away while the job was waiting; skip the work
+            if future.cancelled():
+                continue
+            try:
+                audio = await asyncio.to_thread(load_mono16k, path)
+            except FileNotFoundError:
+                # Deleted while queued: report "gone" rather than an error
+                if not future.done():
+                    future.set_result(None)
+                continue
+            if future.cancelled():
+                continue
+            segments = await asyncio.to_thread(run_transcription, audio)
+            if not future.done():
+                future.set_result(segments)
+        except Exception as e:
+            if not future.done():
+                future.set_exception(e)
+        finally:
+            # A cancelled new upload never gets a row; its handler already
+            # removed the files, but the decode above may have re-created the cache
+            if future.cancelled() and not has_audio_row(path):
+                await asyncio.to_thread(remove_upload, path)
+            transcription_queue.task_done()
+
+async def enqueue_transcription(path):
+    """Queue an upload for the worker; its (start, end, text) tuples, or None if the file is gone"""
+    future = asyncio.get_running_loop().create_future()
+    await transcription_queue.put((path, future))
+    return await future
+
+@asynccontextmanager
+async def lifespan(app):
+    """Load the model and start this process's transcription worker"""
+    global transcription_queue
+    init_model()
+    transcription_queue = asyncio.Queue()
+    worker_task = asyncio.create_task(transcription_worker())
+    yield
+    worker_task.cancel()
+
+# ----------------------
+# App
+# ----------------------
+app = FastAPI(lifespan=lifespan)
+# The inline page (HTML+CSS+JS) compresses ~4x; tiny JSON bodies are left alone
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 # ----------------------
 # UI
 # ----------------------
-@app.get("/", response_class=HTMLResponse)
-def index():
-    return """
+INDEX_HTML = """
 <!DOCTYPE html>
 <html lang="en">
 <head>
@@ -489,6 +727,9 @@ def index():
 <script>
 let currentAudioId = null;
 let deleteAudioId = null;
+let segmentIndex = [];
+let playingSegment = null;
+let activeSegment = null;
 const audio = document.getElementById('audio');
 const uploadBtn = document.getElementById('uploadBtn');
 const fileInput = document.getElementById('file');
@@ -579,45 +820,64 @@ async function loadAudio(id, element) {
   const data = await res.json();
   audio.src = data.audio_url;
 
+  // Build the transcript off-DOM and attach it in one go (single reflow)
   const t = document.getElementById('transcript');
-  t.innerHTML = '';
+  const frag = document.createDocumentFragment();
+  segmentIndex = [];
+  playingSegment = null;
+  activeSegment = null;
   
   data.segments.forEach((s, i) => {
     const span = document.createElement('span');
     span.className = 'segment';
     span.dataset.start = s.start;
     span.dataset.end = s.end;
-    span.innerText = s.text.trim();
+    span.textContent = s.text.trim();
     span.onclick = () => {
       audio.currentTime = s.start;
       audio.play();
-      document.querySelectorAll('.segment').forEach(e => e.classList.remove('active'));
+      if (activeSegment) activeSegment.classList.remove('active');
       span.classList.add('active');
+      activeSegment = span;
     };
-    t.appendChild(span);
+    frag.appendChild(span);
+    segmentIndex.push({ el: span, start: s.start, end: s.end });
     
     // Add line break after each segment for better readability
     if (i < data.segments.length - 1) {
-      t.appendChild(document.createElement('br'));
+      frag.appendChild(document.createElement('br'));
     }
   });
+  
+  t.innerHTML = '';
+  t.appendChild(frag);
 }
 
-// Highlight current segment while playing
-audio.addEventListener('timeupdate', () => {
-  const currentTime = audio.currentTime;
-  const segments = document.querySelectorAll('.segment');
-  
-  segments.forEach(segment => {
-    const start = parseFloat(segment.dataset.start);
-    const end = parseFloat(segment.dataset.end);
-    
-    if (currentTime >= start && currentTime <= end) {
-      segment.classList.add('playing');
+// Binary search the (start-ordered) segments for the one covering `time`
+function findSegment(time) {
+  let lo = 0;
+  let hi = segmentIndex.length - 1;
+  let found = null;
+  while (lo <= hi) {
+    const mid = (lo + hi) >> 1;
+    if (segmentIndex[mid].start <= time) {
+      found = segmentIndex[mid];
+      lo = mid + 1;
     } else {
-      segment.classList.remove('playing');
+      hi = mid - 1;
     }
-  });
+  }
+  return found && time <= found.end ? found.el : null;
+}
+
+// Highlight current segment while playing, touching at most two elements
+audio.addEventListener('timeupdate', () => {
+  const current = findSegment(audio.currentTime);
+  if (current === playingSegment) return;
+  
+  if (playingSegment) playingSegment.classList.remove('playing');
+  if (current) current.classList.add('playing');
+  playingSegment = current;
 });
 
 function showSuccessModal() {
@@ -653,6 +913,9 @@ async function confirmDelete() {
         </div>
       `;
       currentAudioId = null;
+      segmentIndex = [];
+      playingSegment = null;
+      activeSegment = null;
     }
     
     loadLibrary();
@@ -681,73 +944,165 @@ loadLibrary();
 </html>
 """
 
+# The page is static, so hash it once and let browsers revalidate with a 304
+INDEX_ETAG = '"' + hashlib.md5(INDEX_HTML.encode()).hexdigest() + '"'
+INDEX_HEADERS = {"Cache-Control": "public, max-age=3600", "ETag": INDEX_ETAG}
+
+@app.get("/", response_class=HTMLResponse)
+async def index(request: Request):
+    if request.headers.get("if-none-match") == INDEX_ETAG:
+        return Response(status_code=304, headers=INDEX_HEADERS)
+    return HTMLResponse(INDEX_HTML, headers=INDEX_HEADERS)
+
 # ----------------------
 # API
 # ----------------------
+NOT_FOUND_BODY = orjson.dumps({"status": "not_found"})
+
+def not_found():
+    """404 reply shared by the lookup endpoints"""
+    return Response(NOT_FOUND_BODY, status_code=404, media_type="application/json")
+
 @app.post("/transcribe")
-def transcribe(file: UploadFile = File(...)):
+async def transcribe(file: UploadFile = File(...)):
     audio_id = str(uuid.uuid4())
     filename = audio_id + "_" + file.filename
     path = os.path.join(UPLOAD_DIR, filename)
 
-    with open(path, "wb") as f:
-        f.write(file.file.read())
+    try:
+        # Stream the upload to disk in 1 MiB chunks instead of buffering it whole
+        async with aiofiles.open(path, "wb") as f:
+            while chunk := await file.read(1 << 20):
+                await f.write(chunk)
+
+        segments = await enqueue_transcription(path)
+        if segments is None:
+            raise FileNotFoundError(path)
+        rows = [(audio_id, start, end, text) for start, end, text in segments]
 
-    # Use configured language for transcription
-    result = model.transcribe(path, language=config['language'])
+        # Only now touch the DB, so the write transaction stays short
+        db = get_db()
+        db.execute("BEGIN")
+        try:
+            db.execute(INSERT_AUDIO_SQL, (audio_id, filename, file.filename))
+            db.executemany(INSERT_SEGMENT_SQL, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    except BaseException:
+        # Failed or cancelled: no row points at these files, so /delete never could.
+        # Unlink off the event loop, like /delete does
+        await asyncio.to_thread(remove_upload, path)
+        raise
+
+    return {"status": "ok"}
+
+@app.post("/retranscribe/{audio_id}")
+async def retranscribe(audio_id: str):
+    result = get_reader().execute(SEL_FILENAME_SQL, (audio_id,)).fetchone()
+    if result is None:
+        return not_found()
 
-    cursor.execute("INSERT INTO audio VALUES (?, ?, ?)", (audio_id, filename, file.filename))
-    for s in result['segments']:
-        cursor.execute(
-            "INSERT INTO segments VALUES (?, ?, ?, ?)",
-            (audio_id, s['start'], s['end'], s['text'])
-        )
-    conn.commit()
+    # The worker hits the cached 16 kHz buffer, so only the model runs again
+    path = os.path.join(UPLOAD_DIR, result[0])
+    segments = await enqueue_transcription(path)
+
+    # Swap the old segments for the new ones atomically
+    db = get_db()
+    with db:
+        deleted = db.execute(SEL_FILENAME_SQL, (audio_id,)).fetchone() is None
+        if segments is not None and not deleted:
+            db.execute(DEL_SEGMENTS_SQL, (audio_id,))
+            db.executemany(
+                INSERT_SEGMENT_SQL,
+                [(audio_id, start, end, text) for start, end, text in segments]
+            )
+
+    if segments is None or deleted:
+        # A /delete landed while the job was queued or running. Its cleanup may
+        # have run before the worker wrote the decode cache, so sweep again
+        await asyncio.to_thread(remove_upload, path)
+        return not_found()
 
     return {"status": "ok"}
 
 @app.get("/library")
-def library():
-    cursor.execute("SELECT id, original_name FROM audio")
-    return [{"id": r[0], "original_name": r[1]} for r in cursor.fetchall()]
+async def library(request: Request):
+    reader = get_reader()
+    # data_version changes whenever any other connection (our writer included,
+    # in this or another worker process) commits, so the cache can't go stale
+    version = reader.execute("PRAGMA data_version").fetchone()[0]
+    cache = getattr(_local, "library_cache", None)
+    if cache is None or cache[0] != version:
+        rows = reader.execute(SEL_LIB_SQL).fetchall()
+        body = orjson.dumps([{"id": r[0], "original_name": r[1]} for r in rows])
+        cache = _local.library_cache = (version, body, 'W/"' + hashlib.md5(body).hexdigest() + '"')
+
+    _, body, etag = cache
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
 
 @app.get("/audio_data/{audio_id}")
-def audio_data(audio_id: str):
-    cursor.execute("SELECT filename FROM audio WHERE id=?", (audio_id,))
-    filename = cursor.fetchone()[0]
-    cursor.execute("SELECT start, end, text FROM segments WHERE audio_id=?", (audio_id,))
-    segments = [
-        {"start": r[0], "end": r[1], "text": r[2]} for r in cursor.fetchall()
-    ]
-    return {
-        "audio_url": f"/audio/{filename}",
-        "segments": segments
-    }
+async def audio_data(audio_id: str, request: Request):
+    # One round-trip: the audio row joined with its segments (none -> one NULL row)
+    rows = get_reader().execute(SEL_AUDIO_DATA_SQL, (audio_id,)).fetchall()
+    if not rows:
+        return not_found()
+
+    body = orjson.dumps({
+        "audio_url": f"/audio/{rows[0][0]}",
+        "segments": [
+            {"start": r[1], "end": r[2], "text": r[3]} for r in rows if r[1] is not None
+        ]
+    })
+
+    # Re-opening the same transcript revalidates instead of re-downloading it
+    etag = '"' + hashlib.md5(body).hexdigest() + '"'
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+def remove_upload(filepath):
+    """Remove an uploaded file and its decoded cache, ignoring missing files"""
+    for target in (filepath, filepath + ".f32.npy"):
+        try:
+            os.remove(target)
+        except FileNotFoundError:
+            pass
 
 @app.delete("/delete/{audio_id}")
-def delete_audio(audio_id: str):
-    # Get filename to delete the file
-    cursor.execute("SELECT filename FROM audio WHERE id=?", (audio_id,))
-    result = cursor.fetchone()
-    if result:
-        filename = result[0]
-        filepath = os.path.join(UPLOAD_DIR, filename)
-        
-        # Delete the file if it exists
-        if os.path.exists(filepath):
-            os.remove(filepath)
-        
-        # Delete from database
-        cursor.execute("DELETE FROM segments WHERE audio_id=?", (audio_id,))
-        cursor.execute("DELETE FROM audio WHERE id=?", (audio_id,))
-        conn.commit()
-        
-        return {"status": "deleted"}
-    
-    return {"status": "not_found"}
+async def delete_audio(audio_id: str, background_tasks: BackgroundTasks):
+    db = get_db()
+    # Both DELETEs commit together (one WAL commit); idx_seg_audio keeps the
+    # segments delete to an index range instead of a table scan
+    with db:
+        result = db.execute(SEL_FILENAME_SQL, (audio_id,)).fetchone()
+        if result is None:
+            return {"status": "not_found"}
+        db.execute(DEL_SEGMENTS_SQL, (audio_id,))
+        db.execute(DEL_AUDIO_SQL, (audio_id,))
+
+    # Unlink only once the rows are gone, after the response has been sent
+    background_tasks.add_task(remove_upload, os.path.join(UPLOAD_DIR, result[0]))
+
+    return {"status": "deleted"}
 
 @app.get("/audio/{filename}")
-def get_audio(filename: str):
-    return FileResponse(os.path.join(UPLOAD_DIR, filename))
+async def get_audio(filename: str):
+    # Only serve files that belong to a library entry (blocks path traversal)
+    if get_reader().execute(HAS_FILENAME_SQL, (filename,)).fetchone() is None:
+        return not_found()
+
+    # Uploads never change once stored, so let the browser keep them
+    return FileResponse(
+        os.path.join(UPLOAD_DIR, filename),
+        headers={
+            "Cache-Control": "public, max-age=31536000, immutable",
+            "Accept-Ranges": "bytes"
+        }
+    )
 
-# Run: uvicorn app:app --reload
\ No newline at end of file
+# Run: uvicorn app:app --reload
+# Multi-worker: gunicorn -w 4 -k uvicorn_worker.UvicornWorker --timeout 300 app:app
\ No newline at end of file